@@ -136,6 +136,9 @@ WSGI_APPLICATION = 'WebGIS.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# Set to True when POSTGRES_HOST/PORT point at pgbouncer (transaction pooling mode)
+POSTGRES_PGBOUNCER = os.getenv('POSTGRES_PGBOUNCER') == 'True'
+
 DATABASES = {
     'default': {
         'ENGINE': os.getenv('POSTGRES_ENGINE'),
@@ -144,6 +147,14 @@ DATABASES = {
         'PASSWORD': os.getenv('POSTGRES_PASSWORD'),
         'HOST': os.getenv('POSTGRES_HOST'),
         'PORT': os.getenv('POSTGRES_PORT'),
+        # Under ASGI (the deployed gunicorn + UvicornWorker setup) every request runs in a new
+        # thread-sensitive context, so persistent connections are never reused there; pool
+        # with pgbouncer instead. A non-zero value only helps WSGI deployments.
+        'CONN_MAX_AGE': int(os.getenv('POSTGRES_CONN_MAX_AGE', '0')),
+        # pgbouncer in transaction pooling mode supports neither server-side cursors nor
+        # the startup "options" parameter. Long-running migrations lift the timeout themselves.
+        'DISABLE_SERVER_SIDE_CURSORS': POSTGRES_PGBOUNCER,
+        'OPTIONS': {} if POSTGRES_PGBOUNCER else {'options': '-c statement_timeout=30000'},
     }
 }
 
@@ -1,7 +1,9 @@
 from allauth.account.adapter import DefaultAccountAdapter
+from django.db import transaction
 from .tasks import send_email_async
 
 class AsyncAccountAdapter(DefaultAccountAdapter):
     def send_mail(self, template_prefix, email, context):
         msg = self.render_mail(template_prefix, email, context)
-        send_email_async.delay(msg.subject, msg.body, msg.from_email, [email])
+        # Enqueue only once the surrounding transaction commits (immediately in autocommit mode).
+        transaction.on_commit(lambda: send_email_async.delay(msg.subject, msg.body, msg.from_email, [email]))
@@ -1,15 +1,38 @@
-from django.contrib.gis.geos import Polygon, Point, GEOSGeometry
-from django.contrib.gis.db.models.functions import AsGeoJSON, Area, Distance, Centroid
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
+import hashlib
+import os
+import threading
+import uuid
+
+from django.contrib.gis.geos import Polygon, Point
+from django.contrib.gis.db.models import PolygonField, Union as UnionAgg
+from django.contrib.gis.db.models.functions import AsGeoJSON, Area, Distance, Centroid, GeometryDistance
 from django.core.files.storage import default_storage
 from django.core.files.base import ContentFile
-from django.http import JsonResponse
-from ninja import NinjaAPI, UploadedFile
-from osgeo import gdal, ogr, osr
-from api.models import DemoPoint, DemoPolygon, DemoLine
-from .schemas import PolygonIn, PolygonOut, PointIn, PointOut, LineIn, LineOut
+from django.contrib.gis.measure import D, MeasureBase
+from django.db.models import Count, Max
+from django.db.models.functions import Cast
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.timezone import now
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+from ninja import Body, NinjaAPI, UploadedFile
+from ninja.decorators import decorate_view
+import numpy as np
+import orjson
+import pyproj
+from osgeo import gdal, ogr
+from api.models import DemoPoint, DemoPolygon, DemoLine, POINT_GEOGRAPHY
+from .functions import Buffer, SimplifyPreserveTopology
+from .renderers import ORJSONRenderer
+from .schemas import PolygonIn, PolygonOut, PointIn, PointOut, LineIn, LineOut, PixelValuesIn, MAX_BULK_FEATURES
 
 api = NinjaAPI(
     csrf=False,
+    renderer=ORJSONRenderer(),
     title="Django WebGIS API Template",
     description="""
 A boilerplate WebGIS API demonstrating common geospatial capabilities using GeoDjango and PostGIS.
@@ -42,75 +65,150 @@ Built with:
 )
 
 
+def _json_default(obj):
+    """Serialize GeoDjango measures (e.g. Area) as plain numbers in standard units."""
+    if isinstance(obj, MeasureBase):
+        return obj.standard
+    raise TypeError
+
+
+def stream_featurecollection(qs, geom_field='geom', props=('id', 'name')):
+    """
+    Stream a queryset as a GeoJSON FeatureCollection.
+
+    Only ``props`` and the PostGIS-rendered GeoJSON of ``geom_field`` (a field name or
+    geometry expression, or None for no geometry) are selected, and rows are fetched in
+    chunks so memory stays bounded regardless of the number of features. The body is an
+    async generator so the ASGI server sends each chunk as it is produced.
+    """
+    if geom_field is None:
+        rows = qs.values(*props)
+    else:
+        rows = qs.values(*props, geojson=AsGeoJSON(geom_field))
+
+    async def features():
+        yield b'{"type":"FeatureCollection","features":['
+        separator = b''
+        async for row in rows.aiterator(chunk_size=2000):
+            geojson = row.get('geojson')
+            feature = {
+                "type": "Feature",
+                "id": row['id'],
+                "properties": {key: row[key] for key in props if key != 'id'},
+                "geometry": orjson.Fragment(geojson) if geojson is not None else None,
+            }
+            yield separator + orjson.dumps(feature, default=_json_default)
+            separator = b','
+        yield b']}'
+
+    return StreamingHttpResponse(features(), content_type='application/geo+json')
+
+
+def _collection_etag(model):
+    """ETag for a whole table, derived from its row count and most recent update."""
+    state = model.objects.aggregate(last=Max('updated_at'), count=Count('id'))
+    return hashlib.md5(f"{state['last']}:{state['count']}".encode()).hexdigest()
+
+
+def _polygons_etag(request, *args, **kwargs):
+    return _collection_etag(DemoPolygon)
+
+
+def _points_etag(request, *args, **kwargs):
+    return _collection_etag(DemoPoint)
+
+
+def _raster_last_modified(request, *args, **kwargs):
+    try:
+        mtime = os.path.getmtime(request.GET.get('raster_path', ''))
+    except OSError:
+        return None
+    return datetime.fromtimestamp(mtime, tz=timezone.utc)
+
+
+def cache_read_only(view_func):
+    """
+    Short shared caching for read-only endpoints; revalidation is cheap thanks to conditional
+    GET. Applied to 200 and 304 responses only, so errors are never cached.
+    """
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        response = view_func(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            patch_cache_control(response, public=True, max_age=60, stale_while_revalidate=300)
+        return response
+    return wrapper
+
+
 # --- Polygon Features ---
 
 @api.get("/polygons", tags=["Polygons"])
+@decorate_view(condition(etag_func=_polygons_etag), cache_read_only)
 def list_polygons(request):
-    """Return all polygons as GeoJSON."""
-    polygons = DemoPolygon.objects.annotate(geojson=AsGeoJSON('geom')).values('id', 'name', 'geojson')
-    return {"polygons": list(polygons)}
+    """Return all polygons as a GeoJSON FeatureCollection."""
+    return stream_featurecollection(DemoPolygon.objects.all())
 
 
 @api.get("/polygons_in_bbox", tags=["Polygons"])
 def polygons_in_bbox(request, minx: float, miny: float, maxx: float, maxy: float):
     """Return polygons within a bounding box."""
     bbox = Polygon.from_bbox((minx, miny, maxx, maxy))
-    polygons = DemoPolygon.objects.filter(geom__intersects=bbox).annotate(geojson=AsGeoJSON('geom')).values('id',
-                                                                                                            'name',
-                                                                                                            'geojson')
-    return {"polygons": list(polygons)}
+    return stream_featurecollection(DemoPolygon.objects.filter(geom__intersects=bbox))
 
 
 @api.get("/polygon_areas", tags=["Polygons"])
+@decorate_view(condition(etag_func=_polygons_etag), cache_read_only)
 def polygon_areas(request):
     """Return area of polygons."""
-    polygons = DemoPolygon.objects.annotate(area=Area('geom')).values('id', 'name', 'area')
-    return {"polygons": list(polygons)}
+    polygons = DemoPolygon.objects.annotate(area=Area('geom'))
+    return stream_featurecollection(polygons, geom_field=None, props=('id', 'name', 'area'))
 
 
 @api.get("/simplify_polygons", tags=["Polygons"])
 def simplify_polygons(request, tolerance: float = 0.001):
     """Return simplified polygon geometries."""
-    polygons = DemoPolygon.objects.all()
-    simplified = []
-    for poly in polygons:
-        simplified_geom = poly.geom.simplify(tolerance, preserve_topology=True)
-        simplified.append({
-            "id": poly.id,
-            "name": poly.name,
-            "geojson": simplified_geom.geojson
-        })
-    return {"polygons": simplified}
+    return stream_featurecollection(DemoPolygon.objects.all(),
+                                    geom_field=SimplifyPreserveTopology('geom', tolerance))
 
 
 @api.get("/polygon_centroids", tags=["Polygons"])
+@decorate_view(condition(etag_func=_polygons_etag), cache_read_only)
 def polygon_centroids(request):
     """Return centroid of polygons."""
-    polygons = DemoPolygon.objects.annotate(centroid=Centroid('geom')).annotate(geojson=AsGeoJSON('centroid')).values(
-        'id', 'name', 'geojson')
-    return {"polygons": list(polygons)}
+    return stream_featurecollection(DemoPolygon.objects.all(), geom_field=Centroid('geom'))
 
 
 @api.post("/polygons", response=PolygonOut, tags=["Polygons"])
 def create_polygon(request, payload: PolygonIn):
-    geom = GEOSGeometry(payload.geojson)
+    geom = payload.to_geos()
     polygon = DemoPolygon.objects.create(name=payload.name, geom=geom)
-    return PolygonOut(id=polygon.id, name=polygon.name, geojson=polygon.geom.geojson)
+    return PolygonOut(id=polygon.id, name=polygon.name, geojson=payload.geojson)
+
+
+@api.post("/polygons/bulk", response=list[PolygonOut], tags=["Polygons"])
+def create_polygons_bulk(request, payload: list[PolygonIn] = Body(..., max_length=MAX_BULK_FEATURES)):
+    """Create up to MAX_BULK_FEATURES polygons in one batched INSERT."""
+    polygons = [DemoPolygon(name=p.name, geom=p.to_geos()) for p in payload]
+    DemoPolygon.objects.bulk_create(polygons, batch_size=MAX_BULK_FEATURES)
+    return [PolygonOut(id=polygon.id, name=polygon.name, geojson=p.geojson) for polygon, p in zip(polygons, payload)]
 
 
 @api.get("/polygons/{polygon_id}", response=PolygonOut, tags=["Polygons"])
 def get_polygon(request, polygon_id: int):
-    polygon = DemoPolygon.objects.get(id=polygon_id)
-    return PolygonOut(id=polygon.id, name=polygon.name, geojson=polygon.geom.geojson)
+    polygon = DemoPolygon.objects.filter(id=polygon_id).values('id', 'name', geojson=AsGeoJSON('geom')).first()
+    if polygon is None:
+        return JsonResponse({"error": "Polygon not found"}, status=404)
+    return polygon
 
 
 @api.put("/polygons/{polygon_id}", response=PolygonOut, tags=["Polygons"])
 def update_polygon(request, polygon_id: int, payload: PolygonIn):
-    polygon = DemoPolygon.objects.get(id=polygon_id)
-    polygon.name = payload.name
-    polygon.geom = GEOSGeometry(payload.geojson)
-    polygon.save()
-    return PolygonOut(id=polygon.id, name=polygon.name, geojson=polygon.geom.geojson)
+    # QuerySet.update() skips auto_now, so updated_at is set explicitly to keep ETags fresh.
+    updated = DemoPolygon.objects.filter(id=polygon_id).update(
+        name=payload.name, geom=payload.to_geos(), updated_at=now())
+    if not updated:
+        return JsonResponse({"error": "Polygon not found"}, status=404)
+    return PolygonOut(id=polygon_id, name=payload.name, geojson=payload.geojson)
 
 
 @api.delete("/polygons/{polygon_id}", tags=["Polygons"])
@@ -122,19 +220,18 @@ def delete_polygon(request, polygon_id: int):
 # --- Point Features ---
 
 @api.get("/points", tags=["Points"])
+@decorate_view(condition(etag_func=_points_etag), cache_read_only)
 def list_points(request):
-    """Return all points as GeoJSON."""
-    points = DemoPoint.objects.annotate(geojson=AsGeoJSON('geom')).values('id', 'name', 'geojson')
-    return {"points": list(points)}
+    """Return all points as a GeoJSON FeatureCollection."""
+    return stream_featurecollection(DemoPoint.objects.all())
 
 
 @api.get("/points_near", tags=["Points"])
 def points_near(request, lng: float, lat: float, radius_meters: float):
     """Return points within X meters of a point."""
     point = Point(lng, lat, srid=4326)
-    points = DemoPoint.objects.filter(geom__distance_lte=(point, radius_meters)).annotate(
-        geojson=AsGeoJSON('geom')).values('id', 'name', 'geojson')
-    return {"points": list(points)}
+    points = DemoPoint.objects.annotate(geog=POINT_GEOGRAPHY).filter(geog__dwithin=(point, D(m=radius_meters)))
+    return stream_featurecollection(points)
 
 
 # Create Point
@@ -144,24 +241,26 @@ def create_point(request, payload: PointIn):
         name=payload.name,
         geom=Point(payload.lng, payload.lat)
     )
-    return PointOut(id=point.id, name=point.name, lng=point.geom.x, lat=point.geom.y)
+    return PointOut(id=point.id, name=point.name, lng=payload.lng, lat=payload.lat)
 
 
 # Read Point by ID
 @api.get("/points/{point_id}", response=PointOut, tags=["Points"])
 def get_point(request, point_id: int):
-    point = DemoPoint.objects.get(id=point_id)
+    point = DemoPoint.objects.filter(id=point_id).first()
+    if point is None:
+        return JsonResponse({"error": "Point not found"}, status=404)
     return PointOut(id=point.id, name=point.name, lng=point.geom.x, lat=point.geom.y)
 
 
 # Update Point
 @api.put("/points/{point_id}", response=PointOut, tags=["Points"])
 def update_point(request, point_id: int, payload: PointIn):
-    point = DemoPoint.objects.get(id=point_id)
-    point.name = payload.name
-    point.geom = Point(payload.lng, payload.lat)
-    point.save()
-    return PointOut(id=point.id, name=point.name, lng=point.geom.x, lat=point.geom.y)
+    updated = DemoPoint.objects.filter(id=point_id).update(
+        name=payload.name, geom=Point(payload.lng, payload.lat), updated_at=now())
+    if not updated:
+        return JsonResponse({"error": "Point not found"}, status=404)
+    return PointOut(id=point_id, name=payload.name, lng=payload.lng, lat=payload.lat)
 
 
 # Delete Point
@@ -174,24 +273,26 @@ def delete_point(request, point_id: int):
 # --- Line Features ---
 @api.post("/lines", response=LineOut, tags=["Lines"])
 def create_line(request, payload: LineIn):
-    geom = GEOSGeometry(payload.geojson)
+    geom = payload.to_geos()
     line = DemoLine.objects.create(name=payload.name, geom=geom)
-    return LineOut(id=line.id, name=line.name, geojson=line.geom.geojson)
+    return LineOut(id=line.id, name=line.name, geojson=payload.geojson)
 
 
 @api.get("/lines/{line_id}", response=LineOut, tags=["Lines"])
 def get_line(request, line_id: int):
-    line = DemoLine.objects.get(id=line_id)
-    return LineOut(id=line.id, name=line.name, geojson=line.geom.geojson)
+    line = DemoLine.objects.filter(id=line_id).values('id', 'name', geojson=AsGeoJSON('geom')).first()
+    if line is None:
+        return JsonResponse({"error": "Line not found"}, status=404)
+    return line
 
 
 @api.put("/lines/{line_id}", response=LineOut, tags=["Lines"])
 def update_line(request, line_id: int, payload: LineIn):
-    line = DemoLine.objects.get(id=line_id)
-    line.name = payload.name
-    line.geom = GEOSGeometry(payload.geojson)
-    line.save()
-    return LineOut(id=line.id, name=line.name, geojson=line.geom.geojson)
+    updated = DemoLine.objects.filter(id=line_id).update(
+        name=payload.name, geom=payload.to_geos(), updated_at=now())
+    if not updated:
+        return JsonResponse({"error": "Line not found"}, status=404)
+    return LineOut(id=line_id, name=payload.name, geojson=payload.geojson)
 
 
 @api.delete("/lines/{line_id}", tags=["Lines"])
@@ -205,15 +306,11 @@ def delete_line(request, line_id: int):
 @api.get("/points_in_polygon/{polygon_id}", tags=["Spatial Join"])
 def points_in_polygon(request, polygon_id: int):
     """Return points within a polygon."""
-    try:
-        polygon = DemoPolygon.objects.get(id=polygon_id)
-    except DemoPolygon.DoesNotExist:
+    polygon = DemoPolygon.objects.filter(id=polygon_id).values_list('geom', flat=True).first()
+    if polygon is None:
         return JsonResponse({"error": "Polygon not found"}, status=404)
 
-    points = DemoPoint.objects.filter(geom__within=polygon.geom).annotate(geojson=AsGeoJSON('geom')).values('id',
-                                                                                                            'name',
-                                                                                                            'geojson')
-    return {"points": list(points)}
+    return stream_featurecollection(DemoPoint.objects.filter(geom__within=polygon))
 
 
 # --- Nearest Neighbor ---
@@ -222,7 +319,12 @@ def points_in_polygon(request, polygon_id: int):
 def nearest_point(request, lng: float, lat: float):
     """Return the nearest point to a location."""
     point = Point(lng, lat, srid=4326)
-    nearest = DemoPoint.objects.annotate(distance=Distance('geom', point)).order_by('distance').first()
+    # Order by the KNN operator (<->) so the GiST index returns the nearest row; the
+    # exact distance is then only computed for that row.
+    nearest = DemoPoint.objects.defer('geom').annotate(
+        knn=GeometryDistance('geom', point),
+        distance=Distance('geom', point),
+    ).order_by('knn').first()
 
     if nearest:
         return {
@@ -238,10 +340,10 @@ def nearest_point(request, lng: float, lat: float):
 @api.get("/intersection/{poly1_id}/{poly2_id}", tags=["Geometry Operations"])
 def intersection(request, poly1_id: int, poly2_id: int):
     """Return the intersection of two polygons."""
-    try:
-        poly1 = DemoPolygon.objects.get(id=poly1_id)
-        poly2 = DemoPolygon.objects.get(id=poly2_id)
-    except DemoPolygon.DoesNotExist:
+    polygons = DemoPolygon.objects.only('geom').in_bulk([poly1_id, poly2_id])
+    poly1 = polygons.get(poly1_id)
+    poly2 = polygons.get(poly2_id)
+    if poly1 is None or poly2 is None:
         return JsonResponse({"error": "One or both polygons not found"}, status=404)
 
     intersection = poly1.geom.intersection(poly2.geom)
@@ -253,10 +355,10 @@ def intersection(request, poly1_id: int, poly2_id: int):
 @api.get("/difference/{poly1_id}/{poly2_id}", tags=["Geometry Operations"])
 def difference(request, poly1_id: int, poly2_id: int):
     """Return the difference of polygon 1 minus polygon 2."""
-    try:
-        poly1 = DemoPolygon.objects.get(id=poly1_id)
-        poly2 = DemoPolygon.objects.get(id=poly2_id)
-    except DemoPolygon.DoesNotExist:
+    polygons = DemoPolygon.objects.only('geom').in_bulk([poly1_id, poly2_id])
+    poly1 = polygons.get(poly1_id)
+    poly2 = polygons.get(poly2_id)
+    if poly1 is None or poly2 is None:
         return JsonResponse({"error": "One or both polygons not found"}, status=404)
 
     difference = poly1.geom.difference(poly2.geom)
@@ -268,39 +370,123 @@ def difference(request, poly1_id: int, poly2_id: int):
 @api.get("/union_all_polygons", tags=["Geometry Operations"])
 def union_all_polygons(request):
     """Return the union of all polygons."""
-    polygons = DemoPolygon.objects.all()
-    if polygons.exists():
-        union_geom = polygons.first().geom
-        for poly in polygons[1:]:
-            union_geom = union_geom.union(poly.geom)
-        return {"union_geojson": union_geom.geojson}
-    return {"union_geojson": None}
+    row = DemoPolygon.objects.aggregate(geojson=AsGeoJSON(UnionAgg('geom')))
+    return {"union_geojson": row['geojson']}
 
 
 @api.get("/buffer_polygon/{polygon_id}", tags=["Geometry Operations"])
 def buffer_polygon(request, polygon_id: int, buffer_meters: float):
     """Return buffered geometry of polygon."""
-    try:
-        polygon = DemoPolygon.objects.get(id=polygon_id)
-    except DemoPolygon.DoesNotExist:
+    # Buffer the geography cast so the distance is in metres rather than degrees.
+    geography = Cast('geom', PolygonField(geography=True, srid=4326))
+    buffer = DemoPolygon.objects.filter(id=polygon_id).annotate(
+        buffer=AsGeoJSON(Buffer(geography, buffer_meters))).values_list('buffer', flat=True).first()
+    if buffer is None:
         return JsonResponse({"error": "Polygon not found"}, status=404)
 
-    buffer = polygon.geom.buffer(buffer_meters)
-    return {"buffer_geojson": buffer.geojson}
+    return {"buffer_geojson": buffer}
 
 
 # --- GDAL ---
 
+class _RasterCache:
+    """
+    Bounded pool of open read-only GDAL datasets keyed by path and modification time, so
+    warm requests skip re-reading headers and a rewritten file is reopened. GDAL dataset
+    handles are not safe for concurrent use, so a handle is checked out for the duration
+    of ``open()`` and returned to the pool afterwards; concurrent requests for the same
+    raster each get their own handle.
+    """
+
+    def __init__(self, size=64):
+        self.size = size
+        self._idle = OrderedDict()  # (path, mtime) -> idle datasets, least recently used first
+        self._idle_count = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def open(self, path):
+        """Check out an open read-only dataset for ``path``, or None if it cannot be opened."""
+        stat = gdal.VSIStatL(path)  # Also covers /vsi*/ paths, unlike os.stat.
+        ds = None
+        if stat is not None:
+            key = (path, stat.mtime)
+            with self._lock:
+                if self._idle.get(key):
+                    ds = self._idle[key].pop()
+                    self._idle_count -= 1
+            if ds is None:
+                ds = gdal.OpenEx(path, gdal.OF_RASTER | gdal.OF_READONLY)
+        if ds is None:
+            yield None
+            return
+        try:
+            yield ds
+        finally:
+            self._release(key, ds)
+
+    def _release(self, key, ds):
+        with self._lock:
+            self._idle.setdefault(key, []).append(ds)
+            self._idle.move_to_end(key)
+            self._idle_count += 1
+            while self._idle_count > self.size:
+                oldest_key, handles = next(iter(self._idle.items()))
+                handles.pop(0)
+                self._idle_count -= 1
+                if not handles:
+                    del self._idle[oldest_key]
+
+
+_raster_cache = _RasterCache()
+
+# Pixel lookups read one covering window only while it holds at most this many pixels per
+# requested point; sparser point sets are read pixel by pixel.
+PIXEL_WINDOW_FACTOR = 64
+
+
+@lru_cache(maxsize=128)
+def _lonlat_transformer(proj_wkt):
+    """Build (once per projection) the EPSG:4326 lon/lat -> raster CRS transformer."""
+    return pyproj.Transformer.from_crs('EPSG:4326', pyproj.CRS.from_wkt(proj_wkt), always_xy=True)
+
+
+def _sample_pixels(ds, lngs, lats):
+    """Return first-band values at lon/lat locations, with None for locations outside the raster."""
+    gt = ds.GetGeoTransform()
+    band = ds.GetRasterBand(1)
+    transformer = _lonlat_transformer(ds.GetProjection())
+    x_geo, y_geo = transformer.transform(np.asarray(lngs, dtype=float), np.asarray(lats, dtype=float))
+    px = np.floor((x_geo - gt[0]) / gt[1]).astype(np.int64)
+    py = np.floor((y_geo - gt[3]) / gt[5]).astype(np.int64)
+    inside = (px >= 0) & (px < ds.RasterXSize) & (py >= 0) & (py < ds.RasterYSize)
+
+    values = [None] * len(px)
+    if not inside.any():
+        return values
+
+    index, px, py = np.flatnonzero(inside), px[inside], py[inside]
+    xmin, ymin = int(px.min()), int(py.min())
+    width, height = int(px.max()) - xmin + 1, int(py.max()) - ymin + 1
+    if width * height <= PIXEL_WINDOW_FACTOR * len(px):
+        window = band.ReadAsArray(xmin, ymin, width, height)
+        sampled = window[py - ymin, px - xmin].astype(float).tolist()
+    else:
+        sampled = [float(band.ReadAsArray(int(x), int(y), 1, 1)[0][0]) for x, y in zip(px, py)]
+
+    for i, val in zip(index.tolist(), sampled):
+        values[i] = val
+    return values
+
+
 @api.get("/gdal/raster-stats", tags=["GDAL"])
 def raster_stats(request, raster_path: str):
     """Return min, max, mean, and stddev for a raster."""
     try:
-        ds = gdal.Open(raster_path)
-        if not ds:
-            return {"error": "Could not open raster"}
-
-        band = ds.GetRasterBand(1)
-        stats = band.GetStatistics(True, True)
+        with _raster_cache.open(raster_path) as ds:
+            if not ds:
+                return {"error": "Could not open raster"}
+            stats = ds.GetRasterBand(1).GetStatistics(True, True)
         return {
             "min": stats[0],
             "max": stats[1],
@@ -315,26 +501,26 @@ def raster_stats(request, raster_path: str):
 
 @api.get("/gdal/pixel-value", tags=["GDAL"])
 def pixel_value(request, raster_path: str, lng: float, lat: float):
-    """Return the raster pixel value at a specific lon/lat location."""
+    """Return the raster pixel value at a specific lon/lat location (null outside the raster)."""
+    try:
+        with _raster_cache.open(raster_path) as ds:
+            if not ds:
+                return {"error": "Could not open raster"}
+            return {"value": _sample_pixels(ds, [lng], [lat])[0]}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@api.post("/gdal/pixel-values", tags=["GDAL"])
+def pixel_values(request, payload: PixelValuesIn):
+    """Return raster pixel values for a list of lon/lat locations (null outside the raster)."""
     try:
-        ds = gdal.Open(raster_path)
-        if not ds:
-            return {"error": "Could not open raster"}
-        gt = ds.GetGeoTransform()
-        proj = ds.GetProjection()
-
-        srs = osr.SpatialReference(wkt=proj)
-        srs_latlon = osr.SpatialReference()
-        srs_latlon.ImportFromEPSG(4326)
-        transform = osr.CoordinateTransformation(srs_latlon, srs)
-
-        x_geo, y_geo, _ = transform.TransformPoint(lng, lat)
-        px = int((x_geo - gt[0]) / gt[1])
-        py = int((y_geo - gt[3]) / gt[5])
-
-        band = ds.GetRasterBand(1)
-        val = band.ReadAsArray(px, py, 1, 1)
-        return {"value": float(val[0][0])}
+        lngs = [lng for lng, _ in payload.points]
+        lats = [lat for _, lat in payload.points]
+        with _raster_cache.open(payload.raster_path) as ds:
+            if not ds:
+                return {"error": "Could not open raster"}
+            return {"values": _sample_pixels(ds, lngs, lats)}
     except Exception as e:
         return {"error": str(e)}
 
@@ -343,7 +529,10 @@ def pixel_value(request, raster_path: str, lng: float, lat: float):
 def clip_raster(request, raster_path: str, out_path: str, minx: float, miny: float, maxx: float, maxy: float):
     """Clip a raster to a bounding box and save it to disk."""
     try:
-        gdal.Translate(out_path, raster_path, projWin=[minx, maxy, maxx, miny])
+        with _raster_cache.open(raster_path) as ds:
+            if not ds:
+                return {"error": "Could not open raster"}
+            gdal.Translate(out_path, ds, projWin=[minx, maxy, maxx, miny])
         return {"output_path": out_path}
     except Exception as e:
         return {"error": str(e)}
@@ -360,46 +549,65 @@ def vector_schema(request, vector_path: str):
     except Exception as e:
         return {"error": str(e)}
 
+class _VSIMemStream:
+    """
+    Async iterable over an in-memory (/vsimem/) GDAL file, so the ASGI server sends chunks as
+    they are read. StreamingHttpResponse calls close() when the response is closed, even if
+    the client disconnected before iteration started; it unlinks the file and deletes the upload.
+    """
+
+    def __init__(self, path, upload_path, chunk_size=64 * 1024):
+        self.path = path
+        self.upload_path = upload_path
+        self.chunk_size = chunk_size
+
+    async def __aiter__(self):
+        f = gdal.VSIFOpenL(self.path, 'rb')
+        try:
+            while chunk := gdal.VSIFReadL(1, self.chunk_size, f):
+                yield chunk
+        finally:
+            gdal.VSIFCloseL(f)
+
+    def close(self):
+        gdal.Unlink(self.path)
+        default_storage.delete(self.upload_path)
+
+
 @api.post("/gdal/upload-reproject", tags=["GDAL"])
 def upload_and_reproject(request, file: UploadedFile):
     """Upload a vector file and reproject to EPSG:4326, return GeoJSON."""
     input_path = default_storage.save(f"tmp/{file.name}", ContentFile(file.read()))
+    stream = _VSIMemStream(f"/vsimem/{uuid.uuid4().hex}.geojson", input_path)
     try:
-        input_ds = ogr.Open(default_storage.path(input_path))
-        if not input_ds:
+        options = gdal.VectorTranslateOptions(format='GeoJSON', dstSRS='EPSG:4326', reproject=True)
+        out_ds = gdal.VectorTranslate(stream.path, default_storage.path(input_path), options=options)
+        if not out_ds:
+            stream.close()
             return {"error": "Could not open uploaded file"}
-
-        input_layer = input_ds.GetLayer()
-        source_srs = input_layer.GetSpatialRef()
-        target_srs = osr.SpatialReference()
-        target_srs.ImportFromEPSG(4326)
-        transform = osr.CoordinateTransformation(source_srs, target_srs)
-
-        features = []
-        for feat in input_layer:
-            geom = feat.GetGeometryRef()
-            geom.Transform(transform)
-            features.append(geom.ExportToJson())
-
-        return {"features": features}
+        out_ds = None  # Close the dataset so the GeoJSON is flushed before streaming.
     except Exception as e:
+        stream.close()
         return {"error": str(e)}
 
+    return StreamingHttpResponse(stream, content_type='application/geo+json')
+
 
 @api.get("/gdal/raster-metadata", tags=["GDAL"])
+@decorate_view(condition(last_modified_func=_raster_last_modified), cache_read_only)
 def raster_metadata(request, raster_path: str):
     """Return metadata from a raster file."""
     try:
-        dataset = gdal.Open(raster_path)
-        if not dataset:
-            return {"error": "Unable to open raster"}
-
-        return {
-            "driver": dataset.GetDriver().LongName,
-            "size": [dataset.RasterXSize, dataset.RasterYSize],
-            "bands": dataset.RasterCount,
-            "projection": dataset.GetProjection(),
-            "geotransform": dataset.GetGeoTransform()
-        }
+        with _raster_cache.open(raster_path) as dataset:
+            if not dataset:
+                return JsonResponse({"error": "Unable to open raster"}, status=404)
+
+            return {
+                "driver": dataset.GetDriver().LongName,
+                "size": [dataset.RasterXSize, dataset.RasterYSize],
+                "bands": dataset.RasterCount,
+                "projection": dataset.GetProjection(),
+                "geotransform": dataset.GetGeoTransform()
+            }
     except Exception as e:
-        return {"error": str(e)}
+        return JsonResponse({"error": str(e)}, status=500)
@@ -0,0 +1,17 @@
+from django.contrib.gis.db.models.functions import GeoFunc, NUMERIC_TYPES
+
+
+class Buffer(GeoFunc):
+    """PostGIS ST_Buffer(geom, distance); distance is in metres for geography input."""
+    arity = 2
+
+    def __init__(self, expression, distance, **extra):
+        super().__init__(expression, self._handle_param(distance, 'distance', NUMERIC_TYPES), **extra)
+
+
+class SimplifyPreserveTopology(GeoFunc):
+    """PostGIS ST_SimplifyPreserveTopology(geom, tolerance)."""
+    arity = 2
+
+    def __init__(self, expression, tolerance, **extra):
+        super().__init__(expression, self._handle_param(tolerance, 'tolerance', NUMERIC_TYPES), **extra)
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-15 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_demoline'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='demoline',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='demopoint',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='demopolygon',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-15 09:40
+
+import django.contrib.gis.db.models.fields
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_demoline_updated_at_demopoint_updated_at_and_more'),
+    ]
+
+    operations = [
+        # The index build can outlast the connection's statement_timeout on large tables;
+        # SET LOCAL only lasts for this migration's transaction.
+        migrations.RunSQL('SET LOCAL statement_timeout = 0', reverse_sql=migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='demopoint',
+            index=django.contrib.postgres.indexes.GistIndex(django.db.models.functions.comparison.Cast('geom', django.contrib.gis.db.models.fields.PointField(geography=True, srid=4326)), name='api_demopoint_geog_gist'),
+        ),
+    ]
@@ -1,11 +1,15 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser, UserManager
 from django.contrib.gis.db import models
+from django.contrib.postgres.indexes import GistIndex
+from django.db.models.functions import Cast
 
 
 class CustomUserManager(UserManager):
     def get_by_natural_key(self, email):
-        return self.get(email__iexact=email)
+        # Emails are stored lowercased (see CustomUser.save), so a plain equality lookup
+        # can use the unique index instead of scanning with UPPER(email).
+        return self.get(email=email.lower())
 
 
 class CustomUser(AbstractUser):
@@ -27,14 +31,25 @@ class CustomUser(AbstractUser):
 class DemoPolygon(models.Model):
     name = models.CharField(max_length=255)
     geom = models.PolygonField(srid=4326)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
 
 
+# Geography cast of DemoPoint.geom; queries must use this exact expression to hit its GiST index.
+POINT_GEOGRAPHY = Cast('geom', models.PointField(geography=True, srid=4326))
+
+
 class DemoPoint(models.Model):
     name = models.CharField(max_length=255)
     geom = models.PointField(srid=4326)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            GistIndex(POINT_GEOGRAPHY, name='api_demopoint_geog_gist'),
+        ]
 
     def __str__(self):
         return self.name
@@ -43,6 +58,7 @@ class DemoPoint(models.Model):
 class DemoLine(models.Model):
     name = models.CharField(max_length=255)
     geom = models.LineStringField(srid=4326)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
@@ -0,0 +1,12 @@
+import orjson
+from ninja.renderers import BaseRenderer
+from ninja.responses import NinjaJSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Render API responses with orjson, falling back to Ninja's encoder for other types."""
+    media_type = "application/json"
+    charset = "utf-8"
+
+    def render(self, request, data, *, response_status):
+        return orjson.dumps(data, default=NinjaJSONEncoder().default, option=orjson.OPT_SERIALIZE_NUMPY)
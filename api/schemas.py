@@ -1,9 +1,66 @@
+from typing import Annotated, ClassVar
+
+import orjson
+import shapely
+from django.contrib.gis.geos import GEOSGeometry
 from ninja import Schema
+from pydantic import Field, PrivateAttr, StringConstraints, model_validator
+from shapely.errors import GEOSException
+
+# Reject oversized geometries before they are parsed at all.
+MAX_GEOJSON_LENGTH = 1_000_000
+
+GeoJSONStr = Annotated[str, StringConstraints(max_length=MAX_GEOJSON_LENGTH)]
+
+# Most features accepted by one bulk-create request (one INSERT batch).
+MAX_BULK_FEATURES = 500
+
+# Most locations accepted by one pixel-values request.
+MAX_PIXEL_POINTS = 10_000
+
+
+def parse_geojson(value, geom_type):
+    """Parse a GeoJSON geometry object of the given type into a valid shapely geometry."""
+    # Check the top-level object first: shapely would silently unwrap a Feature.
+    try:
+        data = orjson.loads(value)
+    except orjson.JSONDecodeError:
+        raise ValueError("Invalid GeoJSON")
+    if not isinstance(data, dict) or data.get('type') != geom_type:
+        raise ValueError(f"Expected a GeoJSON {geom_type} geometry object")
+    # Coordinates are stored as EPSG:4326 as-is, so a differing CRS must not be accepted silently.
+    if 'crs' in data:
+        raise ValueError("GeoJSON 'crs' members are not supported; send WGS 84 (EPSG:4326) coordinates")
+    try:
+        geom = shapely.from_geojson(value)
+    except GEOSException:
+        raise ValueError("Invalid GeoJSON geometry")
+    if not geom.is_valid:
+        raise ValueError(f"Invalid {geom_type}: {shapely.is_valid_reason(geom)}")
+    return geom
+
 
 # GeoJSON as string — for now (simple approach)
-class PolygonIn(Schema):
+class GeometryIn(Schema):
+    """Input with a GeoJSON geometry string, parsed once during validation."""
+    geom_type: ClassVar[str]
+
     name: str
-    geojson: str
+    geojson: GeoJSONStr
+    _geometry = PrivateAttr(default=None)
+
+    @model_validator(mode='after')
+    def check_geojson(self):
+        self._geometry = parse_geojson(self.geojson, self.geom_type)
+        return self
+
+    def to_geos(self):
+        """Return the validated geometry as a GEOSGeometry (SRID 4326), handed over as WKB."""
+        wkb = shapely.to_wkb(self._geometry, include_srid=False)
+        return GEOSGeometry(memoryview(wkb), srid=4326)
+
+class PolygonIn(GeometryIn):
+    geom_type = 'Polygon'
 
 class PolygonOut(Schema):
     id: int
@@ -21,11 +78,14 @@ class PointOut(Schema):
     lng: float
     lat: float
 
-class LineIn(Schema):
-    name: str
-    geojson: str
+class LineIn(GeometryIn):
+    geom_type = 'LineString'
 
 class LineOut(Schema):
     id: int
     name: str
     geojson: str
+
+class PixelValuesIn(Schema):
+    raster_path: str
+    points: list[tuple[float, float]] = Field(..., max_length=MAX_PIXEL_POINTS)  # (lng, lat)
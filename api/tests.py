@@ -1,3 +1,139 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from django.test import SimpleTestCase
+from osgeo import gdal, osr
+from pydantic import ValidationError
+
+from api.api import _RasterCache, _sample_pixels, pixel_value, pixel_values
+from api.schemas import MAX_GEOJSON_LENGTH, MAX_PIXEL_POINTS, LineIn, PixelValuesIn, PolygonIn
+
+SQUARE = '{"type":"Polygon","coordinates":[[[0,0],[1,0],[1,1],[0,1],[0,0]]]}'
+
+
+def make_raster(path):
+    """Create a 10x10 EPSG:4326 raster covering lon 0..10, lat 0..10; pixel (col, row) holds row * 10 + col."""
+    ds = gdal.GetDriverByName('GTiff').Create(path, 10, 10, 1, gdal.GDT_Float32)
+    ds.SetGeoTransform((0, 1, 0, 10, 0, -1))
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(4326)
+    ds.SetProjection(srs.ExportToWkt())
+    ds.GetRasterBand(1).WriteArray(np.arange(100, dtype=np.float32).reshape(10, 10))
+    ds = None
+
+
+class GeometryInTests(SimpleTestCase):
+    def assertRejected(self, schema, geojson, error_type='value_error'):
+        with self.assertRaises(ValidationError) as ctx:
+            schema(name='test', geojson=geojson)
+        self.assertEqual(ctx.exception.errors()[0]['type'], error_type)
+
+    def test_valid_polygon_is_parsed_once_into_geos(self):
+        geom = PolygonIn(name='square', geojson=SQUARE).to_geos()
+        self.assertEqual(geom.geom_type, 'Polygon')
+        self.assertEqual(geom.srid, 4326)
+        self.assertEqual(geom.area, 1.0)
+
+    def test_valid_line(self):
+        line = LineIn(name='line', geojson='{"type":"LineString","coordinates":[[0,0],[1,1]]}')
+        self.assertEqual(line.to_geos().geom_type, 'LineString')
+
+    def test_rejects_feature(self):
+        self.assertRejected(PolygonIn, '{"type":"Feature","properties":{},"geometry":%s}' % SQUARE)
+
+    def test_rejects_crs_member(self):
+        geojson = SQUARE[:-1] + ',"crs":{"type":"name","properties":{"name":"EPSG:3857"}}}'
+        self.assertRejected(PolygonIn, geojson)
+
+    def test_rejects_wrong_geometry_type(self):
+        self.assertRejected(PolygonIn, '{"type":"LineString","coordinates":[[0,0],[1,1]]}')
+        self.assertRejected(LineIn, SQUARE)
+
+    def test_rejects_invalid_ring(self):
+        bowtie = '{"type":"Polygon","coordinates":[[[0,0],[1,1],[1,0],[0,1],[0,0]]]}'
+        self.assertRejected(PolygonIn, bowtie)
+
+    def test_rejects_malformed_json(self):
+        self.assertRejected(PolygonIn, '{"type":"Polygon",')
+
+    def test_rejects_oversize_string(self):
+        self.assertRejected(PolygonIn, SQUARE + ' ' * (MAX_GEOJSON_LENGTH - len(SQUARE) + 1),
+                            error_type='string_too_long')
+
+
+class PixelValueTests(SimpleTestCase):
+    """Pixel lookups against a 10x10 EPSG:4326 raster covering lon 0..10, lat 0..10."""
+    raster_path = '/vsimem/api_tests_pixels.tif'
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        make_raster(cls.raster_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        gdal.Unlink(cls.raster_path)
+        super().tearDownClass()
+
+    def sample(self, points):
+        ds = gdal.Open(self.raster_path)
+        return _sample_pixels(ds, [lng for lng, _ in points], [lat for _, lat in points])
+
+    def test_samples_pixels_by_lon_lat(self):
+        self.assertEqual(self.sample([(0.5, 9.5), (9.5, 0.5), (3.2, 6.7)]), [0.0, 99.0, 33.0])
+
+    def test_locations_outside_the_raster_are_none(self):
+        # Just left of / above the raster must not truncate to pixel 0.
+        self.assertEqual(self.sample([(-0.5, 5.0), (5.0, 10.5), (10.0, 5.0), (2.5, 2.5)]),
+                         [None, None, None, 72.0])
+
+    def test_pixel_by_pixel_reads_match_window_read(self):
+        points = [(0.5, 9.5), (9.5, 0.5), (4.5, 4.5), (-1.0, -1.0)]
+        windowed = self.sample(points)
+        with mock.patch('api.api.PIXEL_WINDOW_FACTOR', 0):
+            self.assertEqual(self.sample(points), windowed)
+        self.assertEqual(windowed, [0.0, 99.0, 54.0, None])
+
+    def test_no_points(self):
+        self.assertEqual(self.sample([]), [])
+
+    def test_endpoints_share_bounds_handling(self):
+        self.assertEqual(pixel_value(None, self.raster_path, -0.5, 5.0), {"value": None})
+        self.assertEqual(pixel_value(None, self.raster_path, 3.2, 6.7), {"value": 33.0})
+        payload = PixelValuesIn(raster_path=self.raster_path, points=[(-0.5, 5.0), (3.2, 6.7)])
+        self.assertEqual(pixel_values(None, payload), {"values": [None, 33.0]})
+
+    def test_point_count_is_capped(self):
+        with self.assertRaises(ValidationError):
+            PixelValuesIn(raster_path=self.raster_path, points=[(0.0, 0.0)] * (MAX_PIXEL_POINTS + 1))
+
+
+class RasterCacheTests(SimpleTestCase):
+    raster_path = '/vsimem/api_tests_cache.tif'
+
+    def setUp(self):
+        make_raster(self.raster_path)
+        self.addCleanup(gdal.Unlink, self.raster_path)
+
+    def test_reuses_returned_handles(self):
+        cache = _RasterCache()
+        with cache.open(self.raster_path) as first:
+            pass
+        with cache.open(self.raster_path) as second:
+            self.assertIs(second, first)
+
+    def test_concurrent_users_get_separate_handles(self):
+        cache = _RasterCache()
+        with cache.open(self.raster_path) as first, cache.open(self.raster_path) as second:
+            self.assertIsNotNone(first)
+            self.assertIsNot(first, second)
+
+    def test_idle_handles_are_bounded(self):
+        cache = _RasterCache(size=1)
+        with cache.open(self.raster_path), cache.open(self.raster_path):
+            pass
+        self.assertEqual(cache._idle_count, 1)
+
+    def test_missing_raster(self):
+        with _RasterCache().open('/vsimem/does-not-exist.tif') as ds:
+            self.assertIsNone(ds)
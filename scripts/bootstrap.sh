@@ -513,6 +513,8 @@ POSTGRES_USER=$DB_USER
 POSTGRES_PASSWORD=$DB_PASS
 POSTGRES_HOST=localhost
 POSTGRES_PORT=5432
+POSTGRES_CONN_MAX_AGE=0
+POSTGRES_PGBOUNCER=False
 
 # Email settings
 EMAIL_HOST_USER=